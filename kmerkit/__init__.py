@@ -10,14 +10,68 @@ Why not just handle this completely for the user to avoid problems.
 
 __version__ = "0.0.18"
 
-from loguru import logger
+import os
+
+# set KMERKIT_IMPORT_PROFILE=1 to print a cProfile summary to STDERR on
+# exit, e.g., to check what a command imports before doing any work. This
+# runs before the imports below so that the package import is included.
+if os.environ.get("KMERKIT_IMPORT_PROFILE"):
+    import atexit
+    import sys
+    import cProfile
+    import pstats
+
+    _PROFILE = cProfile.Profile()
+    _PROFILE.enable()
+
+    def _print_profile():
+        "Stop the profiler and print the top 30 calls by cumulative time"
+        _PROFILE.disable()
+        stats = pstats.Stats(_PROFILE, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(30)
 
-from kmerkit.kinit import init_project
-from kmerkit.kcount import Kcount
-from kmerkit.kextract import Kextract
-from kmerkit.kmatrix import Kmatrix
-from kmerkit.kmctools import KMCBIN, KMTBIN
+    atexit.register(_print_profile)
+
+import importlib
+from loguru import logger
 from kmerkit.utils import set_loglevel
 
-# start the logger in INFO
+# top-level names mapped to the submodule defining them. These are
+# imported on first access (PEP 562) so that importing kmerkit, e.g.,
+# for its __version__, does not load pydantic or the KMC tools.
+_LAZY_ATTRS = {
+    "init_project": "kmerkit.kinit",
+    "Kcount": "kmerkit.kcount",
+    "Kextract": "kmerkit.kextract",
+    "Kmatrix": "kmerkit.kmatrix",
+    "KMCBIN": "kmerkit.kmctools",
+    "KMTBIN": "kmerkit.kmctools",
+}
+
+__all__ = ["__version__", "logger", "set_loglevel", *_LAZY_ATTRS]
+
+
+def __getattr__(name):
+    """
+    Imports re-exported names, and submodules accessed as attributes
+    (e.g., kmerkit.utils), on first access.
+    """
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as exc:
+        if exc.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    "Lists the lazy names for tab-completion and introspection."
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+# start the logger in WARNING
 set_loglevel("WARNING")
@@ -0,0 +1,7 @@
+#!/usr/bin/env python
+
+"""
+Subcommands of the kmerkit command line interface. Each module
+holds a single click command that is imported by the LazyGroup in
+kmerkit._cli.app only when that command is used.
+"""
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""
+The click app for the kmerkit command line interface. This is
+imported by kmerkit.__main__ only after its fast paths are checked.
+"""
+
+import importlib
+import click
+import lazy_loader as lazy
+from kmerkit import __version__
+
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+# add the -h option for showing help, and show option defaults
+CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'], show_default=True)
+
+# subcommand names mapped to the (module, function) implementing them
+COMMANDS = {
+    "init": ("kmerkit._cli.init", "init"),
+    "stats": ("kmerkit._cli.stats", "stats"),
+    "count": ("kmerkit._cli.count", "count"),
+    "filter": ("kmerkit._cli.filter", "filter_kmers"),
+    "extract": ("kmerkit._cli.extract", "extract"),
+    "trim": ("kmerkit._cli.trim", "trim"),
+    "dump": ("kmerkit._cli.dump", "dump_kmers"),
+    "branch": ("kmerkit._cli.branch", "branch"),
+}
+
+
+class LazyGroup(click.Group):
+    """
+    A click Group that imports a subcommand's module only when that
+    subcommand is resolved, so running one command (or its -h) never
+    builds the others. Commands are listed in the COMMANDS order.
+    """
+    def list_commands(self, ctx):
+        return list(COMMANDS)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in COMMANDS:
+            return None
+        modname, funcname = COMMANDS[cmd_name]
+        return getattr(importlib.import_module(modname), funcname)
+
+
+def version_callback(ctx, param, value):
+    "Adding a --version option to the CLI"
+    if value:
+        click.echo(f"kmerkit {__version__}")
+        ctx.exit()
+
+def docs_callback(ctx, param, value):
+    "function to open docs"
+    if value:
+        import webbrowser
+        click.echo("Opening https://eaton-lab.org/kmerkit in default browser")
+        webbrowser.open("https://eaton-lab.org/kmerkit")
+        ctx.exit()
+
+
+@click.group(cls=LazyGroup, context_settings=CONTEXT_SETTINGS)
+@click.option("-v", "--version", is_flag=True, callback=version_callback, expose_value=False, is_eager=True, help="print version and exit.")
+@click.option("--docs", is_flag=True, callback=docs_callback, expose_value=False, is_eager=True, help="Open documentation in browser.")
+@click.option("--loglevel", type=click.Choice(["DEBUG", "INFO", "WARNING", "ERROR"], case_sensitive=False), default="INFO", help="logging level")
+@click.option("-q", "--quiet", is_flag=True, help="do not print the kmerkit banner.")
+def app(loglevel, quiet):
+    """
+    Call kmerkit commands to access tools in the kmerkit toolkit,
+    and kmerkit COMMAND -h to see help options for each tool
+    (e.g., kmerkit count -h)
+    """
+    # set the loglevel once for whichever command is run
+    utils.set_loglevel(loglevel)
+    if not quiet:
+        click.secho(
+            f"kmerkit (v.{__version__}): the kmer operations toolkit",
+            fg="magenta", bold=True,
+        )
+        click.secho(
+            f"loglevel: {loglevel}, logfile: STDERR",
+            fg="magenta", bold=False,
+        )
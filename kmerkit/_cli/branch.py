@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+
+"""
+kmerkit branch: branch to create a new named project JSON file.
+"""
+
+import os
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+kschema = lazy.load("kmerkit.kschema", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("--force", is_flag=True, help="force overwrite.")
+@click.argument("name")
+def branch(json_file, force, name):
+    """
+    Branch to create a new named project JSON file.
+
+    NAME is the new name of the branched project.
+
+    \b
+    kmerkit branch -j test.json test2
+    """   
+    from loguru import logger
+
+    try:
+        name = name.strip(".json")
+        proj = kschema.Project.parse_file(json_file).dict()
+        proj['name'] = name
+        new_json_file = os.path.join(
+            os.path.dirname(json_file),
+            name + ".json"
+        )
+        if os.path.exists(new_json_file):
+            if not force:
+                msg = "JSON file already exists. Use force."
+                logger.error(msg)
+                raise utils.KmerkitError(msg)
+        with open(new_json_file, 'w') as out:
+            out.write(kschema.Project(**proj).json(indent=4))
+        logger.info(f"wrote new branched project to {new_json_file}")
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+
+"""
+kmerkit count: count kmers in fastq/a files using KMC.
+"""
+
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+kcount = lazy.load("kmerkit.kcount", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("-k", "--kmer-size", type=click.IntRange(min=2), default=17)
+@click.option("--min-depth", type=click.IntRange(min=1), default=1)
+@click.option("--max-depth", type=click.IntRange(min=1), default=int(1e9))
+@click.option("--max-count", type=int, default=255)
+@click.option("--canonical/--no-canonical", default=False)
+@click.option("--workers", type=int, default=None, show_default="min(ncpus / threads, RAM / max-ram-per-worker, nsamples)", help="N worker processes (samples counted in parallel)")
+@click.option("--threads", type=int, default=None, help="N threads per worker")
+@click.option("--force", is_flag=True, help="overwrite existing")
+@click.option("--max-ram-per-worker", type=click.IntRange(min=1), default=12, help="max RAM in Gb")
+def count(
+    json_file,
+    kmer_size,
+    min_depth,
+    max_depth,
+    max_count,
+    canonical,
+    workers,
+    threads,
+    force,
+    max_ram_per_worker,
+    ):
+    """
+    Count kmers in fastq/a files using KMC. 
+
+    kcount will write kmer database files for each sample to 
+    <workdir>/<name>_kcount_.kmc_[suf,pre]. Example:
+
+    \b
+    kmerkit count -j test.json --kmer-size 35 --min-depth 5
+    """
+    # run the command
+    counter = kcount.Kcount(
+        str(json_file),
+        kmer_size=kmer_size,
+        min_depth=min_depth,
+        max_depth=max_depth,
+        max_count=max_count,
+        canonical=canonical,
+    )
+    # print(counter.statsdf.T)
+    try:
+        counter.run(
+            threads=threads, 
+            workers=workers, 
+            force=force, 
+            max_ram=max_ram_per_worker,
+        )
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
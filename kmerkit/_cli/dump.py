@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+"""
+kmerkit dump: write kmers and/or counts to a file from a KMC database.
+"""
+
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+kdump = lazy.load("kmerkit.kdump", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command(name="dump")
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("--min-depth", type=int, default=1, help="filter to >= min-depth")
+@click.option("--max-depth", type=int, default=100000, help="filter to <= max-depth")
+@click.option("--write-kmers/--no-write-kmers", default=True)
+@click.option("--write-counts/--no-write-counts", default=True)
+@click.argument("samples", nargs=-1, required=True)
+def dump_kmers(
+    json_file,
+    min_depth,
+    max_depth,
+    write_kmers,
+    write_counts,
+    samples,
+    ):
+    """
+    Write kmers and/or counts to a file from a KMC database.
+
+    SAMPLES are one or more sample names in the kcount database.
+
+    \b
+    kmerkit dump -j test.json --min-depth 5 sample1
+    """   
+    try:
+        kdump.Kdump(
+            json_file, 
+            list(samples), 
+            min_depth, max_depth, 
+            write_kmers, write_counts,
+        ).run()
+
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+"""
+kmerkit extract: extract reads from fastq/a files containing target kmers.
+"""
+
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+kextract = lazy.load("kmerkit.kextract", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("--min-kmers-per-read", type=int, default=1)
+@click.option("--paired-union/--no-paired-union", default=True)
+@click.option("--force", is_flag=True, help="overwrite existing")
+@click.option("--workers", type=int, default=1, help="N worker processes")
+@click.option("--threads", type=int, default=None, help="N threads per worker")
+@click.argument("samples", nargs=-1)
+def extract(
+    json_file,
+    min_kmers_per_read,
+    paired_union,
+    force,
+    workers,
+    threads,
+    samples,
+    ):
+    """
+    Extract reads from fastq/a files containing target kmers.
+
+    Reads must contain at least 'min-kmers-per-read' kmers in them.
+    If 'keep-paired' then reads are returns as paired-end. Samples can 
+    be entered as arguments in three possible ways: (1) enter sample 
+    names that are in the init database; (2) enter an integer for 
+    group0 or group1 from the kfilter database; (3) enter a file path 
+    to one or more fastq files.
+
+    \b
+    kmerkit extract -j test.json A B C D      # select from init
+    kmerkit extract -j test.json 1            # select from filter group
+    kmerkit extract -j test.json ./data/*.gz  # select new files
+    """
+    try:
+        kex = kextract.Kextract(
+            json_file=json_file,
+            samples=samples,
+            min_kmers_per_read=min_kmers_per_read,
+            paired_union=paired_union,
+        )
+        kex.run(force=force, workers=workers, threads=threads)
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
+    except KeyboardInterrupt as exc:
+        raise click.Abort() from exc
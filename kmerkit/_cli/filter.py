@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""
+kmerkit filter: filter kmers based on frequencies among grouped samples.
+"""
+
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+kfilter = lazy.load("kmerkit.kfilter", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command(name="filter")
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("-0", "--group0", multiple=True)
+@click.option("-1", "--group1", multiple=True)
+@click.option("--traits-file", type=click.Path(path_type=Path), default=None)
+@click.option("--min-cov", type=float, default=0.0)
+@click.option("--min-map", type=float, nargs=2, default=(0.0, 1.0))
+@click.option("--max-map", type=float, nargs=2, default=(0.0, 1.0))
+@click.option("--force", is_flag=True, help="overwrite existing")
+# min_map_canon
+def filter_kmers(
+    json_file,
+    group0,
+    group1,
+    traits_file,
+    min_cov,
+    min_map,
+    max_map,
+    force,
+    ):
+    """
+    Filter kmers based on frequencies among grouped samples.
+
+    The filter kmers (group 0) are subtracted from the target kmers
+    (group 1) to find the final target kmer set. You must enter sample
+    names (or regex patterns) to --group0 and --group1 to assign samples
+    to each group. Kmers in each group are filtered by min-map and 
+    max-map ranges...
+    """
+    # fake data
+    if traits_file:
+        traits_dict = utils.get_traits_dict_from_csv(traits_file)
+    else:
+        traits_dict = {0: [], 1: []}
+    traits_dict[0].extend(group0)
+    traits_dict[1].extend(group1)
+
+    # load database with phenotypes data
+    try:
+        kgp = kfilter.Kfilter(
+            json_file=json_file,
+            traits_dict=traits_dict,
+            min_cov=min_cov,
+            min_map={0: min_map[0], 1: min_map[1]},
+            max_map={0: max_map[0], 1: max_map[1]},        
+            min_map_canon={0: 0.0, 1: 0.5},
+        )
+        kgp.run(force=force)
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+"""
+kmerkit init: initialize a kmerkit project from fastq/a input files.
+"""
+
+import click
+import lazy_loader as lazy
+
+kinit = lazy.load("kmerkit.kinit", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-n", "--name", default="test", help="Project name prefix")
+@click.option("-w", "--workdir", default=None, show_default="system tempdir", help="Project directory")
+@click.option("--delim", default="_", help="sample name delimiter")
+@click.option("--force", is_flag=True, help="overwrite existing")
+@click.argument("data", nargs=-1, required=True)
+def init(name, workdir, delim, force, data):
+    """
+    Initialize a kmerkit project from fastq/a input files.
+
+    Creates a JSON project file in <workdir>/<name>.json. Sample
+    names are parsed from input filenames (DATA) by splitting on the
+    last occurrence of the optional 'delim' character (default is '_').
+    Paired reads are automatically detected from _R1 and _R2 in names.
+    Multiple files can be selected using regular expressions for the
+    data filepath input, or by listing multiple filepaths. Examples:
+
+    \b
+    kmerkit init -n test -w /tmp ./data/fastqs/*.gz
+    kmerkit init -n test -w /tmp ./data-1/A.fastq ./data-2/B.fastq
+    """
+    # default to the system tempdir, resolved only when needed
+    if workdir is None:
+        import tempfile
+        workdir = tempfile.gettempdir()
+
+    try:
+        # parse the fastq_dict from string
+        fastq_dict = utils.get_fastq_dict_from_path(None, data, delim)
+        kinit.init_project(name=name, workdir=workdir, fastq_dict=fastq_dict, force=force)
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+
+"""
+kmerkit stats: return summarized results from kmerkit modules to STDOUT.
+"""
+
+import click
+import lazy_loader as lazy
+
+kstats = lazy.load("kmerkit.kstats", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-j", "--json", "json_file", required=True, help="kmerkit project JSON file")
+@click.argument("module", required=False)
+def stats(json_file, module):
+    """
+    Return summarized results from kmerkit modules to STDOUT.
+
+    If no argument is entered for 'module' then the project JSON
+    file is printed to STDOUT. If a module name is entered (e.g., 
+    'trim' or 'ktrim') then the results of this module will be 
+    summarized and formatted into a tabular (TSV) format and returned.
+    Module names can be entered with or without the 'k' prefix.
+    """
+    try:
+        kst = kstats.Kstats(json_file)
+        if not module:
+            kst.run()
+        else:
+            for mod in module:
+                kst.run(mod.lower().lstrip('k'))
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
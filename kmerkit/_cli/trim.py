@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+"""
+kmerkit trim: trim, filter, or subsample reads using fastp.
+"""
+
+from pathlib import Path
+import click
+import lazy_loader as lazy
+
+ktrim = lazy.load("kmerkit.ktrim", suppress_warning=True)
+utils = lazy.load("kmerkit.utils", suppress_warning=True)
+
+
+@click.command()
+@click.option("-j", "--json", "json_file", type=click.Path(path_type=Path), required=True)
+@click.option("--subsample", type=float, default=None, help="subsample to N reads")
+@click.option("--workers", type=int, default=None, help="N worker processes")
+# @click.option("--threads", type=int, default=None, help="N threads per worker")
+@click.option("--force", is_flag=True, help="overwrite existing")
+def trim(json_file, subsample, workers, force):
+    """
+    Trim, filter, or subsample reads using fastp.
+
+    \b
+    kmerkit trim -j test.json --subsample 1000000 --cores 20
+    """
+    try:
+        ktr = ktrim.Ktrim(json_file=json_file, subsample=subsample)
+        ktr.run(force=force, workers=workers) #, threads=threads)
+    except utils.KmerkitError as exc:
+        raise click.ClickException(str(exc)) from exc
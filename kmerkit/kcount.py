@@ -44,7 +44,7 @@ import numpy as np
 from loguru import logger
 
 from kmerkit.kmctools import KMCBIN
-from kmerkit.utils import get_fastq_dict_from_path, KmerkitError, get_num_cpus
+from kmerkit.utils import get_fastq_dict_from_path, KmerkitError, get_num_cpus, get_total_ram_gb
 from kmerkit.kschema import KcountBase, KcountData, KcountParams, Project
 
 
@@ -186,15 +186,19 @@ class Kcount:
         if not force:
             self.check_overwrite()
 
-        # set cores values to limit njobs to ncores / 4
+        # set cores values to limit njobs to ncores / threads (default 4),
+        # and to the number of max_ram jobs that fit in system memory.
+        ncpus = get_num_cpus()
         if workers in [0, None]:
-            workers = max(1, int(np.ceil(get_num_cpus() / 4)))
-            threads = 4
-        # if user set workers, then scale threads to match
-        else:
-            workers = int(workers)
-            threads = (threads if threads else int(get_num_cpus() / workers))
-            # (threads if threads else 4)
+            workers = max(1, int(np.ceil(ncpus / (threads if threads else 4))))
+            total_ram = get_total_ram_gb()
+            if total_ram and max_ram:
+                workers = min(workers, max(1, int(total_ram / max_ram)))
+
+        # each worker counts one sample at a time, so there is no use in
+        # more workers than samples; then scale threads to fill the cores.
+        workers = min(int(workers), max(1, len(self.fastq_dict)))
+        threads = (threads if threads else max(1, int(ncpus / workers)))
         logger.debug(f"workers={workers}; threads={threads}; max_ram={max_ram}")        
 
         # start jobs and store futures
@@ -24,6 +24,7 @@ import os
 import re
 import gzip
 import time
+import contextlib
 import subprocess
 import concurrent.futures
 import numpy as np
@@ -279,9 +280,11 @@ class Kextract:
 
     def new_match_paired_reads(self, sname, union=True):
         """
-        Get read pairs for all reads in which EITHER has a kmer match.
-        Current approach may be memory crushing... TODO: write chunk 
-        files.
+        Get read pairs for all reads in which EITHER has a kmer match
+        (or BOTH if not union). The kmer-matched reads written by 
+        kmc_tools filter are a subset of the original reads in the same
+        order, so the original and matched files are streamed together
+        in a single pass, keeping only the current read of each in memory.
         """
         logger.info(f"re-matching paired reads in {sname}")
 
@@ -292,131 +295,74 @@ class Kextract:
             f"{self.prefix}_{sname}_R2_tmp.fastq",
         ]
 
-        # -----------------------------------------------------
-        # create set of all read names in new kmer-matched filed
-        # TODO: parallel
-        lines1 = get_line_nos(old_fastqs[0], new_fastqs[0])
-        lines2 = get_line_nos(old_fastqs[1], new_fastqs[1])
-
-        # bail out if no data
-        if (not lines1) or (not lines2):
-            return 0, None
-
-        # -------------------------------------------------------
-        # get union of lines1 and line2
-        if union:
-            lidxs = lines1.union(lines2)
-            logger.debug(
-                f"{sname} union of PE reads: "
-                f"{len(lines1)} U {len(lines2)} = {len(lidxs)}"
+        # open original and kmer-matched files as 4-line iterators. All
+        # handles are registered on the stack so they close on any error.
+        with contextlib.ExitStack() as stack:
+            old1, old2 = (
+                stack.enter_context(
+                    gzip.open(i, 'rt') if i.endswith('.gz') else open(i, 'rt'))
+                for i in old_fastqs
             )
-        else:
-            lidxs = lines1.intersection(lines2)
-        del lines1
-        del lines2
-
-        # skip the rest if no lidxs exist
-        if not lidxs:
-            return 0, None
-
-        # write lines to new files
-        fname1 = new_fastqs[0].replace("_tmp.fastq", ".fastq.gz")
-        fname2 = new_fastqs[1].replace("_tmp.fastq", ".fastq.gz")
-        out1 = gzip.open(fname1, 'wt')
-        out2 = gzip.open(fname2, 'wt')
-        old1 = (
-            gzip.open(old_fastqs[0], 'rt') if old_fastqs[0].endswith('.gz') 
-            else open(old_fastqs[0], 'rt')
-        )
-        old2 =  (
-            gzip.open(old_fastqs[1], 'rt') if old_fastqs[1].endswith('.gz') 
-            else open(old_fastqs[1], 'rt')
-        )
-        
-        # read chunks of 4 lines
-        quart1 = zip(old1, old1, old1, old1)
-        quart2 = zip(old2, old2, old2, old2)
-
-        # save each 4-line chunk to chunks if it lidxs
-        chunks1 = []
-        chunks2 = []
-        idx = 0
-
-        # iterate until end of file
-        while 1:
-            try:
-                ch_r1 = next(quart1)
-                ch_r2 = next(quart2)
-                if idx in lidxs:
+            new1, new2 = (stack.enter_context(open(i, 'rt')) for i in new_fastqs)
+            quart1 = zip(old1, old1, old1, old1)
+            quart2 = zip(old2, old2, old2, old2)
+            match1 = zip(new1, new1, new1, new1)
+            match2 = zip(new2, new2, new2, new2)
+
+            # get first matched read of each (UNLESS file is empty!)
+            next1 = next(match1, None)
+            next2 = next(match2, None)
+
+            # bail out if no data
+            if (next1 is None) or (next2 is None):
+                return 0, None
+
+            # write lines to new files
+            fname1 = new_fastqs[0].replace("_tmp.fastq", ".fastq.gz")
+            fname2 = new_fastqs[1].replace("_tmp.fastq", ".fastq.gz")
+            out1 = stack.enter_context(gzip.open(fname1, 'wt'))
+            out2 = stack.enter_context(gzip.open(fname2, 'wt'))
+
+            # save each 4-line chunk to chunks if either (or both) matched
+            chunks1 = []
+            chunks2 = []
+            nreads = 0
+            for ch_r1, ch_r2 in zip(quart1, quart2):
+
+                # advance a matched iterator when its next header is this read
+                hit1 = (next1 is not None) and (ch_r1[0] == next1[0])
+                if hit1:
+                    next1 = next(match1, None)
+                hit2 = (next2 is not None) and (ch_r2[0] == next2[0])
+                if hit2:
+                    next2 = next(match2, None)
+
+                if (hit1 or hit2) if union else (hit1 and hit2):
                     chunks1.extend(ch_r1)
                     chunks2.extend(ch_r2)
-            except StopIteration:
-                break
-            idx += 1
+                    nreads += 1
 
-            # occasionally write to disk and clear
-            if len(chunks1) == 10000:
+                # occasionally write to disk and clear
+                if len(chunks1) >= 10000:
+                    out1.write("".join(chunks1))
+                    out2.write("".join(chunks2))
+                    chunks1 = []
+                    chunks2 = []
+
+            if chunks1:
                 out1.write("".join(chunks1))
                 out2.write("".join(chunks2))
-                chunks1 = []
-                chunks2 = []
-
-        if chunks1:
-            out1.write("".join(chunks1))
-            out2.write("".join(chunks2))            
-        out1.close()
-        out2.close()
-        old1.close()
-        old2.close()                        
 
-        # return the number of paired reads
-        return len(lidxs), (fname1, fname2)
-
-
-
-def get_line_nos(fastq_big, fastq_small):
-    """
-    Get line-nos ...
-    """
-    # store lines from big that are in small
-    line_nos = set()
+        logger.debug(f"{sname} {'union' if union else 'intersect'} of PE reads: {nreads}")
 
-    # get 4-line iterator
-    bi_data = (
-        gzip.open(fastq_big, 'rt') if fastq_big.endswith('.gz')
-        else open(fastq_big, 'r')
-    )
-    quart_big = zip(bi_data, bi_data, bi_data, bi_data)
+        # skip the rest if no reads matched
+        if not nreads:
+            os.remove(fname1)
+            os.remove(fname2)
+            return 0, None
 
-    # get 4-line iterator
-    si_data = (
-        gzip.open(fastq_small, 'rt') if fastq_small.endswith('.gz')
-        else open(fastq_small, 'r')
-    )
-    quart_small = zip(si_data, si_data, si_data, si_data)
-
-    # get first chunk (UNLESS file is empty!)
-    try:
-        header_big = next(quart_big)[0]
-        header_small = next(quart_small)[0]
-    except StopIteration:
-        return None
-
-    idx = 0
-    while 1:
-        try:
-            # advance both if they match, else only the big one
-            if header_big == header_small:
-                header_big, seqb, _, _ = next(quart_big)
-                header_small = next(quart_small)[0]
-                line_nos.add(idx)
-                # print(idx, len(line_nos), seqb)
-            else:
-                header_big = next(quart_big)[0]
-            idx += 1
-        except StopIteration:
-            break
-    return line_nos 
+        # return the number of paired reads
+        return nreads, (fname1, fname2)
 
 
 
@@ -5,7 +5,7 @@ Returns statistics and status for a project JSON file.
 """
 
 import itertools
-import typer
+import click
 import pandas as pd
 from loguru import logger
 from kmerkit.kschema import Project, Kinit
@@ -32,9 +32,9 @@ class Kstats:
         """
         If no module is selected then we simply return the JSON
         """
-        typer.secho(
+        click.secho(
             f"Project JSON data:",
-            fg=typer.colors.CYAN,
+            fg="cyan",
         )
         print(self.project.json(indent=4, exclude_none=True))
 
@@ -43,17 +43,17 @@ class Kstats:
         """
         Returns a text description of stats to STDOUT
         """
-        typer.secho(
+        click.secho(
             f"Project: {self.proj['name']}", 
-            fg=typer.colors.CYAN,
+            fg="cyan",
         )
         modules = [i for i in self.proj if (self.proj[i] and i[0] == 'k')]
 
         # if only init has been run then show init files and exit
         if modules == ['kinit']:
-            typer.secho(
+            click.secho(
                 "No modules run yet.\nJSON:", 
-                fg=typer.colors.CYAN,
+                fg="cyan",
             )
             self.json()
             return
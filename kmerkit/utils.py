@@ -11,7 +11,6 @@ import platform
 import subprocess
 from typing import List
 from copy import copy
-import pandas as pd
 from loguru import logger
 
 
@@ -128,6 +127,8 @@ def get_traits_dict_from_csv(csv_file, **kwargs):
     respectively. The first row should include a header, even though
     the column names will not be used.
     """
+    # pandas is only needed here, so don't load it for every CLI command
+    import pandas as pd
     data = pd.read_csv(csv_file, **kwargs)
     data.iloc[:, 1] = data.iloc[:, 1].astype(int)
     groups = data.groupby(data.columns[1])
@@ -179,6 +180,11 @@ def get_fastq_dict_from_path(
         files.extend([
             os.path.realpath(os.path.expanduser(str(i))) for i in fastq_list
         ])
+        missing = [i for i in files if not os.path.exists(i)]
+        if missing:
+            msg = f"fastq files not found: {missing}"
+            logger.error(msg)
+            raise KmerkitError(msg)
     
     # check for files
     if not any(files):
@@ -285,14 +291,26 @@ def get_num_cpus():
     return ncpus
 
 
+def get_total_ram_gb():
+    """
+    Return the total physical memory of the system in Gb as an integer
+    for either Unix or MacOSX (Darwin), or None if it cannot be found.
+    """
+    try:
+        nbytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+    return int(nbytes / 1024 ** 3)
+
+
 def colorize():
     """
     check whether terminal/tty supports color
     """
-    try:
-        import IPython
-        TTY1 = bool(IPython.get_ipython())
-    except ImportError:
-        TTY1 = False
+    # IPython is always already imported when running inside it, so
+    # only check an imported module rather than importing it here.
+    ipython = sys.modules.get("IPython")
+    TTY1 = bool(ipython and ipython.get_ipython())
     TTY2 = sys.stderr.isatty()
     return TTY1 or TTY2
+
@@ -37,13 +37,14 @@ setup(
         "future",
         "loguru", 
         "pandas",
-        "typer",
+        "click>=8.0",
+        "lazy_loader>=0.3",
         # kmc,
         # fastp,
         # gemma,
     ],
     entry_points={
-        "console_scripts": ["kmerkit = kmerkit.__main__:app"]
+        "console_scripts": ["kmerkit = kmerkit.__main__:main"]
     },
     license='GPL',
     classifiers=[